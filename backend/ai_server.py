@@ -180,7 +180,7 @@ Format the response as a JSON object with the following structure:
 }}"""
 
         # Get recommendations from HuggingFace API
-        api_url = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+        api_url = os.getenv('HUGGINGFACE_API_URL', "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2")
         headers = {"Authorization": f"Bearer {os.getenv('HUGGINGFACE_API_KEY')}"}
         
         response = requests.post(api_url, headers=headers, json={"inputs": prompt})
@@ -190,7 +190,7 @@ Format the response as a JSON object with the following structure:
             return get_fallback_recommendations(job_type, skills)
         
         try:
-            recommendations = json.loads(response.text[0]['generated_text'])
+            recommendations = json.loads(response.json()[0]['generated_text'])
             logger.info("Successfully parsed AI recommendations")
         except (json.JSONDecodeError, KeyError, IndexError) as e:
             logger.error(f"Error parsing AI response: {str(e)}")
@@ -548,7 +548,8 @@ def fetch_udemy_courses(query, max_results=5):
             logger.error("Udemy API key not found")
             return []
         
-        url = f"https://www.udemy.com/api-2.0/courses/?search={query}&page_size={max_results}"
+        base_url = os.getenv('UDEMY_API_URL', "https://www.udemy.com/api-2.0")
+        url = f"{base_url}/courses/?search={query}&page_size={max_results}"
         headers = {
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json'
@@ -0,0 +1 @@
+"""Load-testing harness for the AI analysis server (ai_server.py)"""
@@ -0,0 +1,237 @@
+"""Load-test ai_server.py against local HuggingFace and Udemy mocks
+
+Note that /analyze does not call the Udemy API today (fetch_udemy_courses is
+not wired into it), so the Udemy mock and its --udemy-* options have no effect
+on the measured requests until it is.
+
+Examples (run from the backend directory):
+
+    # Start the mocks and a local ai_server.py, then hold 16 requests in flight for 60s
+    python -m loadtest --concurrency 16 --duration 60
+
+    # Fixed arrival rate against a server you started yourself, e.g. under gunicorn
+    python -m loadtest --mocks-only --hf-port 9001 --udemy-port 9002
+    HUGGINGFACE_API_URL=http://127.0.0.1:9001 UDEMY_API_URL=http://127.0.0.1:9002 \\
+        gunicorn -w 4 -b 127.0.0.1:5000 ai_server:app
+    python -m loadtest --target http://127.0.0.1:5000 --rate 20 --duration 60
+"""
+import argparse
+import json
+import logging
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from .mocks import MockHuggingFaceServer, MockUdemyServer, parse_latency
+from .runner import LoadDriver
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+logger = logging.getLogger('loadtest')
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Threaded Flask dev server; use --server-cmd to try gunicorn/waitress worker layouts instead
+DEFAULT_SERVER_CMD = (
+    f'{shlex.quote(sys.executable)} -c '
+    '"import ai_server; ai_server.app.run(host=\'127.0.0.1\', port={port}, threaded=True)"'
+)
+
+
+def latency_spec(value):
+    """argparse type that validates a latency spec up front"""
+    try:
+        parse_latency(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest', description='Load-test the /analyze endpoint of ai_server.py')
+
+    load = parser.add_argument_group('load profile')
+    mode = load.add_mutually_exclusive_group()
+    mode.add_argument('--concurrency', type=int, help='closed loop: number of requests kept in flight (default 8)')
+    mode.add_argument('--rate', type=float, help='open loop: requests started per second')
+    load.add_argument('--duration', type=float, default=30.0, help='seconds to generate load (default 30)')
+    load.add_argument('--max-in-flight', type=int, default=256, help='cap on outstanding requests in --rate mode')
+    load.add_argument('--warmup', type=int, default=3, help='unmeasured requests sent before the run (default 3)')
+    load.add_argument('--timeout', type=float, default=30.0, help='per-request timeout in seconds')
+    load.add_argument('--payload', help='JSON file with the /analyze request body (default: built-in sample resume)')
+
+    mocks = parser.add_argument_group('mock APIs', 'latency specs (ms): fixed:MS, uniform:LO:HI, normal:MEAN:SD, lognormal:MEDIAN:SIGMA, exp:MEAN')
+    mocks.add_argument('--hf-latency', type=latency_spec, default='lognormal:800:0.4', help='HuggingFace latency distribution')
+    mocks.add_argument('--hf-error-rate', type=float, default=0.0, help='fraction of HuggingFace calls answered with 503')
+    mocks.add_argument('--hf-port', type=int, default=0, help='HuggingFace mock port (default: random free port)')
+    mocks.add_argument('--udemy-latency', type=latency_spec, default='lognormal:250:0.3', help='Udemy latency distribution (no effect: /analyze does not call Udemy yet)')
+    mocks.add_argument('--udemy-error-rate', type=float, default=0.0, help='fraction of Udemy calls answered with 503 (no effect: /analyze does not call Udemy yet)')
+    mocks.add_argument('--udemy-port', type=int, default=0, help='Udemy mock port (default: random free port)')
+    mocks.add_argument('--mocks-only', action='store_true', help='only run the mocks until interrupted')
+
+    server = parser.add_argument_group('server under test')
+    server.add_argument('--target', help='base URL of an already running ai_server (skips launching one)')
+    server.add_argument('--server-cmd', default=DEFAULT_SERVER_CMD, help='command used to launch ai_server; {port} is substituted')
+    server.add_argument('--startup-timeout', type=float, default=300.0, help='seconds to wait for the launched server (model loading is slow)')
+
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+
+    args = parser.parse_args(argv)
+    if args.concurrency is None and args.rate is None:
+        args.concurrency = 8
+
+    if args.concurrency is not None and args.concurrency <= 0:
+        parser.error('--concurrency must be positive')
+    if args.rate is not None and args.rate <= 0:
+        parser.error('--rate must be positive')
+    if args.duration <= 0:
+        parser.error('--duration must be positive')
+    if args.max_in_flight <= 0:
+        parser.error('--max-in-flight must be positive')
+    for name in ('hf_error_rate', 'udemy_error_rate'):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    return args
+
+
+def find_free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url, process, timeout):
+    """Poll the server root endpoint until it answers or the timeout expires"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"ai_server exited during startup with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(url + '/', timeout=2) as response:
+                if response.status == 200:
+                    return
+        except Exception:
+            time.sleep(1)
+    raise RuntimeError(f"ai_server did not become ready within {timeout:.0f}s")
+
+
+def launch_server(args, hf, udemy):
+    """Start ai_server with its external API URLs pointed at the mocks"""
+    port = find_free_port()
+    env = dict(
+        os.environ,
+        HUGGINGFACE_API_URL=hf.url,
+        HUGGINGFACE_API_KEY=os.getenv('HUGGINGFACE_API_KEY', 'loadtest'),
+        UDEMY_API_URL=udemy.url,
+        UDEMY_API_KEY=os.getenv('UDEMY_API_KEY', 'loadtest')
+    )
+    cmd = shlex.split(args.server_cmd.replace('{port}', str(port)))
+    logger.info(f"Launching ai_server: {' '.join(cmd)}")
+    process = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env)
+
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(url, process, args.startup_timeout)
+    except Exception:
+        stop_server(process)
+        raise
+    return url, process
+
+
+def stop_server(process):
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def print_report(report):
+    latency = report['latency_ms']
+    print()
+    print('=== Load Test Report ===')
+    print(f"Mode:            {report['mode']}")
+    print(f"Requests:        {report['requests']} in {report['elapsed_s']}s")
+    print(f"Throughput:      {report['throughput_rps']} req/s ({report['successful_rps']} successful req/s)")
+    print(f"Error rate:      {report['error_rate'] * 100:.2f}%  status codes: {report['status_codes']}")
+    print(f"Fallback rate:   {report['fallback_rate'] * 100:.2f}% of successful responses")
+    print(
+        f"Latency (ms):    mean {latency['mean']}  p50 {latency['p50']}  p90 {latency['p90']}  "
+        f"p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}"
+    )
+    for name, stats in report['mocks'].items():
+        print(f"Mock {name + ':':<11} {stats['requests']} calls, {stats['errors']} injected/failed")
+    if not report['mocks']['udemy']['requests']:
+        print("                 (/analyze does not call Udemy yet, so Udemy latency was not part of this run)")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    hf = MockHuggingFaceServer(latency=args.hf_latency, error_rate=args.hf_error_rate, port=args.hf_port).start()
+    udemy = MockUdemyServer(latency=args.udemy_latency, error_rate=args.udemy_error_rate, port=args.udemy_port).start()
+    logger.info(f"HuggingFace mock listening on {hf.url}")
+    logger.info(f"Udemy mock listening on {udemy.url}")
+
+    process = None
+    try:
+        if args.mocks_only:
+            logger.info("Running mocks only, press Ctrl+C to stop")
+            while True:
+                time.sleep(1)
+
+        if args.target:
+            target = args.target
+        else:
+            target, process = launch_server(args, hf, udemy)
+
+        payload = None
+        if args.payload:
+            with open(args.payload) as f:
+                payload = json.load(f)
+
+        driver = LoadDriver(target, payload=payload, timeout=args.timeout)
+        driver.warmup(args.warmup)
+
+        # Only count mock traffic generated during the measured run
+        before = {'huggingface': hf.stats.snapshot(), 'udemy': udemy.stats.snapshot()}
+
+        if args.rate is not None:
+            logger.info(f"Sending {args.rate} req/s for {args.duration}s to {target}")
+            report = driver.run_rate(args.rate, args.duration, args.max_in_flight)
+            report['mode'] = f"rate {args.rate} req/s"
+        else:
+            logger.info(f"Holding {args.concurrency} requests in flight for {args.duration}s against {target}")
+            report = driver.run_concurrency(args.concurrency, args.duration)
+            report['mode'] = f"concurrency {args.concurrency}"
+
+        after = {'huggingface': hf.stats.snapshot(), 'udemy': udemy.stats.snapshot()}
+        report['mocks'] = {
+            name: {key: after[name][key] - before[name][key] for key in after[name]}
+            for name in after
+        }
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_report(report)
+        return 0
+
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        logger.error(f"Load test failed: {str(e)}")
+        return 1
+    finally:
+        if process:
+            stop_server(process)
+        hf.stop()
+        udemy.stop()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
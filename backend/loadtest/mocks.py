@@ -0,0 +1,230 @@
+"""Local stand-ins for the HuggingFace inference and Udemy course APIs"""
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Marker used to tell mocked AI recommendations apart from the fallback ones
+MOCK_COMPANY = 'LoadTest Mock Co'
+
+
+def parse_latency(spec):
+    """Parse a latency spec into a sampler returning seconds
+
+    Supported specs (values in milliseconds):
+        fixed:MS
+        uniform:LO:HI
+        normal:MEAN:STDDEV
+        lognormal:MEDIAN:SIGMA
+        exp:MEAN
+    """
+    parts = spec.split(':')
+    kind = parts[0].lower()
+    try:
+        args = [float(p) for p in parts[1:]]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec!r}")
+    if any(a < 0 for a in args):
+        raise ValueError(f"Latency spec values must be non-negative: {spec!r}")
+
+    if kind == 'fixed' and len(args) == 1:
+        return lambda: args[0] / 1000
+    if kind == 'uniform' and len(args) == 2:
+        return lambda: random.uniform(args[0], args[1]) / 1000
+    if kind == 'normal' and len(args) == 2:
+        return lambda: max(0.0, random.gauss(args[0], args[1])) / 1000
+    if kind == 'lognormal' and len(args) == 2:
+        # Median of a lognormal is exp(mu), so mu = ln(median)
+        mu = math.log(args[0]) if args[0] > 0 else 0.0
+        return lambda: random.lognormvariate(mu, args[1]) / 1000
+    if kind == 'exp' and len(args) == 1:
+        return lambda: (random.expovariate(1 / args[0]) if args[0] > 0 else 0.0) / 1000
+
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+def build_mock_recommendations():
+    """Build a recommendations payload shaped like the one ai_server.py asks the model for"""
+    return {
+        'job_recommendations': [
+            {
+                'title': 'Software Engineer',
+                'company': MOCK_COMPANY,
+                'location': 'Remote',
+                'description': 'Build and maintain backend services',
+                'required_skills': ['python', 'sql', 'docker'],
+                'matched_skills': ['python', 'sql'],
+                'missing_skills': ['docker'],
+                'match_score': 82,
+                'salary_range': '$90k - $120k',
+                'job_link': 'http://localhost/jobs/1',
+                'experience_level': 'Mid-level',
+                'match_details': 'Strong overlap with core backend skills'
+            }
+        ],
+        'course_recommendations': [
+            {
+                'name': 'Docker for Developers',
+                'provider': 'Udemy',
+                'description': 'Containerise and ship applications',
+                'skills_covered': ['docker'],
+                'prerequisites': [],
+                'duration': '10 hours',
+                'level': 'Intermediate',
+                'link': 'http://localhost/courses/1',
+                'match_score': 88
+            }
+        ],
+        'certification_recommendations': [
+            {
+                'name': 'Cloud Practitioner',
+                'provider': 'AWS',
+                'description': 'Foundational cloud certification',
+                'skills_covered': ['aws'],
+                'prerequisites': [],
+                'duration': '1 month',
+                'level': 'Beginner',
+                'link': 'http://localhost/certs/1',
+                'match_score': 75
+            }
+        ]
+    }
+
+
+def build_mock_courses(query, page_size):
+    """Build a Udemy course search response"""
+    return {
+        'count': page_size,
+        'results': [
+            {
+                'title': f'{query.title()} Course {i + 1}',
+                'description': f'Learn {query} step by step',
+                'url': f'/course/{query.replace(" ", "-")}-{i + 1}/'
+            }
+            for i in range(page_size)
+        ]
+    }
+
+
+class MockStats:
+    """Thread-safe request/error counters for a mock server"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, error):
+        with self._lock:
+            self.requests += 1
+            if error:
+                self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {'requests': self.requests, 'errors': self.errors}
+
+
+class MockAPIServer:
+    """Threaded HTTP server that injects latency and errors before answering"""
+
+    def __init__(self, name, latency='fixed:0', error_rate=0.0, host='127.0.0.1', port=0):
+        self.name = name
+        self.sample_latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.stats = MockStats()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def respond(self, method, path, body):
+        """Return (status, payload) for a request; overridden per API"""
+        raise NotImplementedError
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self, method):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+
+                time.sleep(max(0.0, server.sample_latency()))
+
+                if random.random() < server.error_rate:
+                    status, payload = 503, {'error': f'{server.name} mock injected failure'}
+                else:
+                    status, payload = server.respond(method, self.path, body)
+                server.stats.record(status >= 400)
+
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle('GET')
+
+            def do_POST(self):
+                self._handle('POST')
+
+            def log_message(self, format, *args):
+                # Keep the load-test output readable
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f'{self.name}-mock', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MockHuggingFaceServer(MockAPIServer):
+    """Stand-in for the HuggingFace text-generation inference endpoint"""
+
+    def __init__(self, **kwargs):
+        super().__init__('huggingface', **kwargs)
+        self._generated_text = json.dumps(build_mock_recommendations())
+
+    def respond(self, method, path, body):
+        if method != 'POST':
+            return 405, {'error': 'Method not allowed'}
+        return 200, [{'generated_text': self._generated_text}]
+
+
+class MockUdemyServer(MockAPIServer):
+    """Stand-in for the Udemy course search API
+
+    Only fetch_udemy_courses in ai_server.py talks to Udemy, and /analyze does
+    not call it today, so this mock sees no traffic from a load-test run yet.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__('udemy', **kwargs)
+
+    def respond(self, method, path, body):
+        parsed = urlparse(path)
+        if method != 'GET' or not parsed.path.rstrip('/').endswith('/courses'):
+            return 404, {'error': 'Not found'}
+
+        params = parse_qs(parsed.query)
+        query = params.get('search', ['course'])[0]
+        page_size = int(params.get('page_size', ['5'])[0])
+        return 200, build_mock_courses(query, page_size)
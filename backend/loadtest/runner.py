@@ -0,0 +1,186 @@
+"""Drive the /analyze endpoint and collect throughput, latency and fallback metrics"""
+import json
+import math
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from .mocks import MOCK_COMPANY
+
+# Representative request body, matching what the Node backend forwards to /analyze
+SAMPLE_PAYLOAD = {
+    'text': (
+        'Backend engineer with four years of experience building REST APIs in Python and Node.js. '
+        'Designed PostgreSQL schemas, containerised services with Docker and set up CI/CD pipelines. '
+        'Mentored junior developers and led the migration of a monolith to microservices.'
+    ),
+    'job_type': 'software_development',
+    'location': 'Remote',
+    'skills': [
+        {'name': 'Python', 'level': 'Advanced'},
+        {'name': 'JavaScript', 'level': 'Intermediate'},
+        {'name': 'SQL', 'level': 'Advanced'},
+        {'name': 'Docker', 'level': 'Intermediate'},
+        {'name': 'Git', 'level': 'Advanced'},
+        {'name': 'REST API', 'level': 'Advanced'}
+    ],
+    'education': [
+        {'degree': 'Bachelors', 'field': 'Computer Science'}
+    ],
+    'experience': [
+        {'role': 'Mid-level', 'duration': 2.5},
+        {'role': 'Junior', 'duration': 1.5}
+    ]
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def classify_response(status, body):
+    """Classify an /analyze response as 'ai', 'fallback' or 'error'"""
+    if status != 200:
+        return 'error'
+    try:
+        jobs = json.loads(body).get('job_recommendations') or []
+        # Only the mocked model output carries MOCK_COMPANY; anything else came from the fallback path
+        if any(isinstance(job, dict) and job.get('company') == MOCK_COMPANY for job in jobs):
+            return 'ai'
+    except (ValueError, AttributeError, TypeError):
+        return 'error'
+    return 'fallback'
+
+
+class Results:
+    """Thread-safe accumulator for per-request outcomes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.outcomes = Counter()
+        self.statuses = Counter()
+
+    def record(self, latency, status, outcome):
+        with self._lock:
+            self.latencies.append(latency)
+            self.outcomes[outcome] += 1
+            self.statuses[status] += 1
+
+    def summary(self, elapsed):
+        with self._lock:
+            latencies = sorted(self.latencies)
+            outcomes = dict(self.outcomes)
+            statuses = {str(k): v for k, v in self.statuses.items()}
+
+        total = len(latencies)
+        ok = outcomes.get('ai', 0) + outcomes.get('fallback', 0)
+        to_ms = lambda s: round(s * 1000, 2)
+
+        return {
+            'requests': total,
+            'elapsed_s': round(elapsed, 2),
+            'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+            'successful_rps': round(ok / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(outcomes.get('error', 0) / total, 4) if total else 0.0,
+            'fallback_rate': round(outcomes.get('fallback', 0) / ok, 4) if ok else 0.0,
+            'outcomes': outcomes,
+            'status_codes': statuses,
+            'latency_ms': {
+                'mean': to_ms(sum(latencies) / total) if total else 0.0,
+                'p50': to_ms(percentile(latencies, 50)),
+                'p90': to_ms(percentile(latencies, 90)),
+                'p95': to_ms(percentile(latencies, 95)),
+                'p99': to_ms(percentile(latencies, 99)),
+                'max': to_ms(latencies[-1]) if latencies else 0.0
+            }
+        }
+
+
+class LoadDriver:
+    """Send /analyze requests either at a fixed concurrency or a fixed arrival rate"""
+
+    def __init__(self, target, payload=None, timeout=30.0):
+        self.url = target.rstrip('/') + '/analyze'
+        self.body = json.dumps(payload or SAMPLE_PAYLOAD).encode('utf-8')
+        self.timeout = timeout
+
+    def send(self):
+        """Send one request and return (status, body); status 0 means a transport failure"""
+        req = urllib.request.Request(
+            self.url,
+            data=self.body,
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+        except Exception:
+            return 0, b''
+
+    def _timed_send(self, results, started_at):
+        status, body = self.send()
+        try:
+            outcome = classify_response(status, body)
+        except Exception:
+            # Never lose a request from the stats because its body was unexpected
+            outcome = 'error'
+        results.record(time.perf_counter() - started_at, status, outcome)
+
+    def warmup(self, count):
+        """Send a few unmeasured requests so lazy initialisation doesn't skew results"""
+        for _ in range(count):
+            self.send()
+
+    def run_concurrency(self, concurrency, duration):
+        """Closed loop: each of `concurrency` workers sends back-to-back requests"""
+        results = Results()
+        deadline = time.perf_counter() + duration
+
+        def worker():
+            while time.perf_counter() < deadline:
+                self._timed_send(results, time.perf_counter())
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results.summary(time.perf_counter() - start)
+
+    def run_rate(self, rate, duration, max_in_flight=256):
+        """Open loop: start requests on a fixed schedule regardless of response times
+
+        Latency is measured from the scheduled start time, so queueing caused by a
+        saturated server (or by hitting max_in_flight) shows up in the percentiles.
+        """
+        results = Results()
+        interval = 1.0 / rate
+        total = int(rate * duration)
+
+        start = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=max_in_flight)
+        try:
+            for i in range(total):
+                scheduled = start + i * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._timed_send, results, scheduled)
+            pool.shutdown(wait=True)
+        except KeyboardInterrupt:
+            # Don't wait for a backlog of queued requests against a saturated server
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        return results.summary(time.perf_counter() - start)
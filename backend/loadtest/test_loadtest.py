@@ -0,0 +1,117 @@
+"""Tests for the load-testing harness (run from backend/: python -m pytest loadtest)"""
+import json
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from .mocks import MOCK_COMPANY, MockHuggingFaceServer, parse_latency
+from .runner import LoadDriver, Results, classify_response, percentile
+
+
+def test_parse_latency_distributions_are_non_negative():
+    for spec in ['fixed:5', 'uniform:0:10', 'normal:5:50', 'lognormal:5:0.5', 'exp:5', 'fixed:0', 'exp:0']:
+        sample = parse_latency(spec)
+        assert all(sample() >= 0 for _ in range(200))
+    assert parse_latency('fixed:250')() == 0.25
+
+
+@pytest.mark.parametrize('spec', ['fixed:-5', 'uniform:-10:5', 'fixed:abc', 'fixed', 'gamma:1:2', 'uniform:1'])
+def test_parse_latency_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_latency(spec)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([7], 1) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_classify_response():
+    ai = json.dumps({'job_recommendations': [{'company': MOCK_COMPANY}]})
+    fallback = json.dumps({'job_recommendations': [{'company': 'Tech Company'}]})
+    assert classify_response(200, ai) == 'ai'
+    assert classify_response(200, fallback) == 'fallback'
+    assert classify_response(200, json.dumps({'job_recommendations': None})) == 'fallback'
+    assert classify_response(200, json.dumps({'job_recommendations': ['x', None]})) == 'fallback'
+    assert classify_response(200, json.dumps({'job_recommendations': 5})) == 'error'
+    assert classify_response(200, json.dumps([1, 2])) == 'error'
+    assert classify_response(200, b'not json') == 'error'
+    assert classify_response(500, ai) == 'error'
+    assert classify_response(0, b'') == 'error'
+
+
+def test_results_summary():
+    results = Results()
+    for latency in (0.1, 0.2, 0.3):
+        results.record(latency, 200, 'ai')
+    results.record(0.4, 200, 'fallback')
+    results.record(1.0, 503, 'error')
+
+    summary = results.summary(elapsed=2.0)
+    assert summary['requests'] == 5
+    assert summary['throughput_rps'] == 2.5
+    assert summary['successful_rps'] == 2.0
+    assert summary['error_rate'] == 0.2
+    assert summary['fallback_rate'] == 0.25
+    assert summary['status_codes'] == {'200': 4, '503': 1}
+    assert summary['latency_ms']['p50'] == 300.0
+    assert summary['latency_ms']['max'] == 1000.0
+
+    empty = Results().summary(elapsed=0)
+    assert empty['requests'] == 0
+    assert empty['latency_ms']['p99'] == 0.0
+
+
+@pytest.fixture
+def stub_server():
+    """Stand-in for ai_server /analyze that calls the HuggingFace mock and falls back on failure"""
+    hf = MockHuggingFaceServer(latency='fixed:1', error_rate=0.5).start()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            try:
+                req = urllib.request.Request(hf.url, data=b'{}', method='POST')
+                with urllib.request.urlopen(req) as response:
+                    recs = json.loads(json.loads(response.read())[0]['generated_text'])
+            except Exception:
+                recs = {'job_recommendations': [{'company': 'Tech Company'}]}
+            data = json.dumps(recs).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hf
+
+    server.shutdown()
+    server.server_close()
+    hf.stop()
+
+
+def test_driver_smoke(stub_server):
+    target, hf = stub_server
+    driver = LoadDriver(target, timeout=5)
+
+    report = driver.run_concurrency(concurrency=4, duration=0.5)
+    assert report['requests'] > 0
+    assert report['error_rate'] == 0.0
+    assert report['outcomes']['ai'] + report['outcomes']['fallback'] == report['requests']
+    # Half the mocked model calls fail, so both paths should show up
+    assert 0.0 < report['fallback_rate'] < 1.0
+    assert hf.stats.snapshot()['requests'] == report['requests']
+
+    report = driver.run_rate(rate=40, duration=0.5)
+    assert report['requests'] == 20